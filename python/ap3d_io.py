@@ -0,0 +1,187 @@
+"""
+Shared I/O helpers for the visualization scripts.
+
+Holds the trajectory readers, the parameter-file parser and the cylinder
+mesh builder used by generate_mp4.py and generate_video.py, so fixes land
+in one place. load_simulation caches parsed trajectories, letting one
+invocation produce several outputs from a single parse.
+"""
+
+import functools
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+RNG_SEED = 42
+RENDER_MAX_PARTICLES = 20_000
+
+
+@dataclass
+class SimData:
+    """Trajectory in its natural frame-major SoA layout."""
+
+    positions: np.ndarray  # (num_frames, num_particles, 3) float32
+    orientations: np.ndarray | None  # (num_frames, num_particles, 3) float32
+    timesteps: np.ndarray  # (num_frames,) int32
+    particle_ids: np.ndarray  # (num_particles,) smallest fitting uint
+
+
+def _particle_id_range(num_particles):
+    """Particle ids in the smallest integer dtype that fits them."""
+    return np.arange(num_particles, dtype=np.min_scalar_type(max(num_particles - 1, 0)))
+
+
+def read_parameters(filename):
+    """Read the parameter file shared with the C++ simulation."""
+    values = Path(filename).read_text().split()
+    return {
+        "epsilon": float(values[0]),
+        "delta": float(values[1]),
+        "particles": int(values[2]),
+        "Dt": float(values[3]),
+        "De": float(values[4]),
+        "vs": float(values[5]),
+        "wall": float(values[6]),
+        "height": float(values[7]),
+        "iterations": int(values[8]),
+    }
+
+
+def read_binary_simulation(filename, load_orientations=False):
+    """Read the binary trajectory into a SimData structure.
+
+    The file starts with two int32 values (number of particles, number of
+    recorded frames); each frame is one int32 timestep followed by the
+    x, y, z, ex, ey, ez arrays as contiguous float64 blocks. The file is
+    memory-mapped with a structured dtype and kept in its on-disk SoA
+    shape — per-frame access is plain array indexing, no filtering.
+
+    Rendering only needs positions, so orientations are skipped unless
+    requested; the memmap never touches their pages in that case.
+    """
+    with open(filename, "rb") as f:
+        num_particles, num_frames = np.fromfile(f, dtype=np.int32, count=2)
+
+    frame_dtype = np.dtype(
+        [
+            ("t", "<i4"),
+            ("x", "<f8", num_particles),
+            ("y", "<f8", num_particles),
+            ("z", "<f8", num_particles),
+            ("ex", "<f8", num_particles),
+            ("ey", "<f8", num_particles),
+            ("ez", "<f8", num_particles),
+        ]
+    )
+    frames = np.memmap(
+        filename, dtype=frame_dtype, mode="r", offset=8, shape=(num_frames,)
+    )
+
+    # fill a preallocated float32 block one field at a time: the memmap is
+    # read in field-sized pieces and no stacked float64 copy is ever built
+    positions = np.empty((num_frames, num_particles, 3), dtype=np.float32)
+    for axis, name in enumerate(("x", "y", "z")):
+        positions[:, :, axis] = frames[name]
+    orientations = None
+    if load_orientations:
+        orientations = np.empty((num_frames, num_particles, 3), dtype=np.float32)
+        for axis, name in enumerate(("ex", "ey", "ez")):
+            orientations[:, :, axis] = frames[name]
+    return SimData(
+        positions=positions,
+        orientations=orientations,
+        timesteps=np.asarray(frames["t"]),
+        particle_ids=_particle_id_range(num_particles),
+    )
+
+
+def read_csv_simulation(filename, load_orientations=False):
+    """Read the legacy CSV trajectory written by print_file."""
+    import pandas as pd  # only the legacy CSV path needs pandas
+
+    df = pd.read_csv(filename)
+    df["Particles"] = df["Particles"].str.removeprefix("Particles").astype(int)
+    num_particles = df["Particles"].nunique()
+    num_frames = len(df) // num_particles
+    positions = (
+        df[["x-position", "y-position", "z-position"]]
+        .to_numpy(np.float32)
+        .reshape(num_frames, num_particles, 3)
+    )
+    orientations = None
+    if load_orientations:
+        orientations = (
+            df[["ex-orientation", "ey-orientation", "ez-orientation"]]
+            .to_numpy(np.float32)
+            .reshape(num_frames, num_particles, 3)
+        )
+    timesteps = df["time"].to_numpy(np.int32)[::num_particles].copy()
+    return SimData(
+        positions=positions,
+        orientations=orientations,
+        timesteps=timesteps,
+        particle_ids=_particle_id_range(num_particles),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def load_simulation(filename, load_orientations=False):
+    """Read a binary trajectory, caching the parsed SimData per file."""
+    return read_binary_simulation(filename, load_orientations)
+
+
+def select_tracked_particles(particle_ids, num_tracked):
+    """Pick the tracked particles with a fixed seed.
+
+    Both scripts share this so the MP4 and the HTML animation track the
+    same particles, and reruns are reproducible. The sample is returned
+    sorted: frames store particles in id order, so an ascending index
+    gathers them in memory order.
+    """
+    rng = np.random.default_rng(RNG_SEED)
+    # the draw order is irrelevant, so skip the Fisher-Yates shuffle
+    return np.sort(rng.choice(particle_ids, size=num_tracked, replace=False, shuffle=False))
+
+
+def tracking_colors(num_tracked):
+    """Evenly spaced tracking palette as a (num_tracked, 3) float RGB array.
+
+    Vectorized hls_to_rgb over the whole hue ramp (lightness 0.5,
+    saturation 0.7), replacing the per-particle colorsys calls so the
+    palette stays numpy-native when the tracked set grows.
+    """
+    hue = np.arange(num_tracked, dtype=np.float32) / num_tracked
+    lightness, saturation = 0.5, 0.7
+    a = saturation * min(lightness, 1.0 - lightness)
+
+    def channel(n):
+        k = (n + hue * 12.0) % 12.0
+        return lightness - a * np.clip(np.minimum(k - 3.0, 9.0 - k), -1.0, 1.0)
+
+    # red, green and blue are the same formula at offsets 0, 8 and 4
+    return np.stack([channel(0.0), channel(8.0), channel(4.0)], axis=-1)
+
+
+def downsample_particles(num_particles, cap=RENDER_MAX_PARTICLES):
+    """Indices of the particles to draw, capped for overly dense scenes.
+
+    Above the cap, markers shrink to sub-pixel size and only cost render
+    time, so a fixed random subset is drawn instead. Seeded with RNG_SEED
+    so every frame shows the same particles.
+    """
+    if num_particles <= cap:
+        return np.arange(num_particles)
+    rng = np.random.default_rng(RNG_SEED)
+    return np.sort(rng.choice(num_particles, size=cap, replace=False))
+
+
+def create_cylinder_surface(wall, height_min, height_max):
+    """Build the meshgrid of the confining cylinder."""
+    theta = np.linspace(0.0, 2.0 * np.pi, 50)
+    z = np.linspace(height_min, height_max, 30)
+    # outer products on the 1-D rings avoid the full trig grids of meshgrid
+    x_grid = np.outer(np.ones_like(z), wall * np.cos(theta))
+    y_grid = np.outer(np.ones_like(z), wall * np.sin(theta))
+    z_grid = np.outer(z, np.ones_like(theta))
+    return x_grid, y_grid, z_grid
@@ -0,0 +1,114 @@
+"""
+Benchmark reporting for the simulation backends.
+
+Reads a timing table (CSV with columns Particles, Single_CPU_Time,
+OpenMP_6_Time, GPU_Time — seconds per run) and reports the speedups and
+the recommended configuration for every particle count, as an interactive
+HTML page and a static PNG.
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+RESULTS_FILE = Path("../src/data/benchmark_results.csv")
+OUTPUT_HTML = Path("benchmark.html")
+OUTPUT_PNG = Path("benchmark.png")
+SMALL_THRESHOLD = 1000
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def load_results(filename):
+    """Read the timing table and derive the speedup columns."""
+    df = pd.read_csv(filename)
+    df["OpenMP_vs_Single"] = df["Single_CPU_Time"] / df["OpenMP_6_Time"]
+    df["GPU_vs_Single"] = df["Single_CPU_Time"] / df["GPU_Time"]
+    df["GPU_vs_OpenMP"] = df["OpenMP_6_Time"] / df["GPU_Time"]
+    return df
+
+
+def print_summary(df):
+    """Log the fastest configuration for every particle count."""
+    conditions = [
+        (df["GPU_Time"] < df["OpenMP_6_Time"])
+        & (df["GPU_Time"] < df["Single_CPU_Time"]),
+        df["OpenMP_6_Time"] < df["Single_CPU_Time"],
+    ]
+    choices = ["GPU", "OpenMP (6 threads)"]
+    config = np.select(conditions, choices, default="Single CPU")
+    for particles, recommended in zip(df["Particles"].to_numpy(), config):
+        logger.info("N=%d: fastest configuration is %s", particles, recommended)
+
+
+def create_plots(df, write_png=False):
+    """Bar charts of the speedups for small and large runs.
+
+    The PNG export is opt-in: kaleido spawns a headless Chrome and adds
+    seconds of startup cost, while the HTML is the artifact we usually
+    deliver.
+    """
+    small = df[df["Particles"] <= SMALL_THRESHOLD]
+    large = df[df["Particles"] > SMALL_THRESHOLD]
+    traces = [
+        ("OpenMP_vs_Single", "OpenMP vs Single CPU", "#636efa"),
+        ("GPU_vs_Single", "GPU vs Single CPU", "#ef553b"),
+        ("GPU_vs_OpenMP", "GPU vs OpenMP", "#00cc96"),
+    ]
+
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=(
+            f"Up to {SMALL_THRESHOLD} particles",
+            f"More than {SMALL_THRESHOLD} particles",
+        ),
+    )
+    for col, subset in enumerate((small, large), start=1):
+        for column, name, color in traces:
+            values = subset[column].to_numpy()
+            fig.add_trace(
+                go.Bar(
+                    x=subset["Particles"],
+                    y=values,
+                    name=name,
+                    marker_color=color,
+                    text=np.char.add(np.round(values, 2).astype(str), "x"),
+                    # one legend entry per metric, not one per subplot
+                    showlegend=col == 1,
+                ),
+                row=1,
+                col=col,
+            )
+    fig.update_layout(
+        title="Simulation backend speedups",
+        yaxis_title="Speedup",
+        barmode="group",
+    )
+    fig.write_html(OUTPUT_HTML, include_plotlyjs="cdn")
+    if write_png:
+        fig.write_image(OUTPUT_PNG, width=2000, height=550, scale=2)
+    return fig
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--png",
+        action="store_true",
+        help="also export the static PNG via kaleido (slow Chrome startup)",
+    )
+    args = parser.parse_args()
+    df = load_results(RESULTS_FILE)
+    print_summary(df)
+    create_plots(df, write_png=args.png)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Generate MP4 videos of the confined active particle simulation.
+
+Reads the trajectory written by the C++ code (src/data/simulation.bin,
+one int32 timestep followed by the x, y, z, ex, ey, ez float64 blocks per
+recorded frame) and renders one 3D scatter frame per timestep with
+matplotlib (Agg backend), piping raw RGB frames into ffmpeg.
+"""
+
+import functools
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+# PyAV encodes the raw frames in-process, skipping the subprocess pipe
+try:
+    import av
+except ImportError:
+    av = None
+
+from ap3d_io import (
+    create_cylinder_surface,
+    downsample_particles,
+    load_simulation,
+    read_parameters,
+    select_tracked_particles,
+    tracking_colors,
+)
+
+WIDTH = 1920
+HEIGHT = 1080
+DPI = 100
+FPS = 30
+NUM_TRACKED = 17
+
+DATA_FILE = Path("../src/data/simulation.bin")
+CSV_FILE = Path("../src/data/simulation.csv")
+PARAMETER_FILE = Path("../src/parameter.txt")
+OUTPUT_MP4 = Path("simulation.mp4")
+OUTPUT_TRACKING_MP4 = Path("simulation_tracking.mp4")
+
+
+def render_standard_frame(positions, timestep, cylinder, wall, height_min, height_max):
+    """Render one standard frame standalone, outside the pool pipeline.
+
+    Returns the raw RGB pixels of the frame as bytes.
+    """
+    _init_render_worker(cylinder, wall, height_min, height_max, None)
+    try:
+        return _render_one_standard((positions, timestep))
+    finally:
+        plt.close(_WORKER_STATE["fig"])
+        _WORKER_STATE.clear()
+
+
+def render_tracking_frame(positions, timestep, colors, cylinder, wall, height_min, height_max):
+    """Render one tracking frame standalone, outside the pool pipeline.
+
+    Returns the raw RGB pixels of the frame as bytes.
+    """
+    _init_render_worker(cylinder, wall, height_min, height_max, colors)
+    try:
+        return _render_one_tracking((positions, timestep))
+    finally:
+        plt.close(_WORKER_STATE["fig"])
+        _WORKER_STATE.clear()
+
+
+def _figure_to_rgb(fig):
+    """Rasterize a figure and return its raw RGB pixels."""
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba())
+    return rgba[:, :, :3].tobytes()
+
+
+_WORKER_STATE = {}
+
+
+def _init_render_worker(cylinder, wall, height_min, height_max, colors):
+    """Build the figure each pool worker reuses for all of its frames."""
+    fig = plt.figure(figsize=(WIDTH / DPI, HEIGHT / DPI), dpi=DPI)
+    ax = fig.add_subplot(projection="3d")
+    ax.plot_surface(*cylinder, color="gray", alpha=0.1, linewidth=0)
+    ax.set_xlim(-wall, wall)
+    ax.set_ylim(-wall, wall)
+    ax.set_zlim(height_min, height_max)
+    _WORKER_STATE.update(
+        fig=fig,
+        ax=ax,
+        colors=colors,
+        height_min=height_min,
+        height_max=height_max,
+        scatter=None,
+    )
+
+
+def _render_one_standard(args):
+    """Process-pool entry point for one standard frame."""
+    positions, timestep = args
+    ax = _WORKER_STATE["ax"]
+    scatter = _WORKER_STATE["scatter"]
+    if scatter is None:
+        scatter = ax.scatter(
+            positions[:, 0],
+            positions[:, 1],
+            positions[:, 2],
+            c=positions[:, 2],
+            cmap="viridis",
+            s=20,
+            vmin=_WORKER_STATE["height_min"],
+            vmax=_WORKER_STATE["height_max"],
+        )
+        _WORKER_STATE["scatter"] = scatter
+    else:
+        # mutate the existing artist instead of rebuilding the whole scene
+        scatter._offsets3d = (positions[:, 0], positions[:, 1], positions[:, 2])
+        scatter.set_array(positions[:, 2])
+    ax.set_title(f"Active particles in cylindrical confinement - timestep {timestep}")
+    return _figure_to_rgb(_WORKER_STATE["fig"])
+
+
+def _render_one_tracking(args):
+    """Process-pool entry point for one tracking frame."""
+    positions, timestep = args
+    ax = _WORKER_STATE["ax"]
+    scatter = _WORKER_STATE["scatter"]
+    if scatter is None:
+        scatter = ax.scatter(
+            positions[:, 0],
+            positions[:, 1],
+            positions[:, 2],
+            c=_WORKER_STATE["colors"],
+            s=20,
+        )
+        _WORKER_STATE["scatter"] = scatter
+    else:
+        scatter._offsets3d = (positions[:, 0], positions[:, 1], positions[:, 2])
+    ax.set_title(f"Tracked particles - timestep {timestep}")
+    return _figure_to_rgb(_WORKER_STATE["fig"])
+
+
+@functools.lru_cache(maxsize=1)
+def encoder_args():
+    """Pick a hardware H.264 encoder when ffmpeg offers one."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        encoders = result.stdout
+    except (OSError, subprocess.CalledProcessError):
+        encoders = ""
+    if "h264_nvenc" in encoders:
+        return ["-c:v", "h264_nvenc", "-preset", "p4", "-cq", "23"]
+    if "h264_videotoolbox" in encoders:
+        return ["-c:v", "h264_videotoolbox", "-q:v", "50"]
+    if "h264_qsv" in encoders:
+        return ["-c:v", "h264_qsv", "-global_quality", "23"]
+    return ["-c:v", "libx264", "-crf", "23", "-preset", "veryfast"]
+
+
+def encode_frames(frame_iter, output_mp4):
+    """Encode raw RGB frames into an MP4.
+
+    Uses PyAV when it is installed — the frames go straight into libx264
+    without crossing a subprocess pipe — and falls back to piping into an
+    ffmpeg process otherwise.
+    """
+    if av is not None:
+        _encode_frames_pyav(frame_iter, output_mp4)
+    else:
+        _encode_frames_ffmpeg(frame_iter, output_mp4)
+
+
+def _encode_frames_pyav(frame_iter, output_mp4):
+    """Feed the frame buffers to libx264 in-process via PyAV."""
+    with av.open(str(output_mp4), "w") as container:
+        stream = container.add_stream("libx264", rate=FPS)
+        stream.width = WIDTH
+        stream.height = HEIGHT
+        stream.pix_fmt = "yuv420p"
+        stream.options = {"crf": "23", "preset": "veryfast"}
+        for buf in frame_iter:
+            pixels = np.frombuffer(buf, dtype=np.uint8).reshape(HEIGHT, WIDTH, 3)
+            frame = av.VideoFrame.from_ndarray(pixels, format="rgb24")
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+
+
+def _encode_frames_ffmpeg(frame_iter, output_mp4):
+    """Pipe raw RGB frames into an ffmpeg subprocess."""
+    command = [
+        "ffmpeg",
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{WIDTH}x{HEIGHT}",
+        "-framerate",
+        str(FPS),
+        "-i",
+        "-",
+        *encoder_args(),
+        "-pix_fmt",
+        "yuv420p",
+        str(output_mp4),
+    ]
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=1 << 20,
+    )
+    for frame in frame_iter:
+        process.stdin.write(frame)
+    process.stdin.close()
+    stderr = process.stderr.read()
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, command, stderr=stderr.decode(errors="replace")
+        )
+
+
+def generate_standard_mp4(sim, wall, height_min, height_max, output_mp4):
+    """Render every recorded timestep and encode the standard video."""
+    cylinder = create_cylinder_surface(wall, height_min, height_max)
+    render_idx = downsample_particles(sim.positions.shape[1])
+    positions = sim.positions[:, render_idx, :]
+    tasks = [
+        (positions[idx], int(timestep)) for idx, timestep in enumerate(sim.timesteps)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_render_worker,
+        initargs=(cylinder, wall, height_min, height_max, None),
+    ) as executor:
+        encode_frames(executor.map(_render_one_standard, tasks), output_mp4)
+
+
+def generate_tracking_mp4(sim, wall, height_min, height_max, output_mp4):
+    """Render every recorded timestep and encode the tracking video."""
+    num_tracked = min(NUM_TRACKED, len(sim.particle_ids))
+    tracked_particles = select_tracked_particles(sim.particle_ids, num_tracked)
+    colors = tracking_colors(num_tracked)
+    # particle ids are positions' second axis, so tracking is one fancy index
+    tracked_positions = sim.positions[:, tracked_particles, :]
+    cylinder = create_cylinder_surface(wall, height_min, height_max)
+    tasks = [
+        (tracked_positions[idx], int(timestep))
+        for idx, timestep in enumerate(sim.timesteps)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_render_worker,
+        initargs=(cylinder, wall, height_min, height_max, colors),
+    ) as executor:
+        encode_frames(executor.map(_render_one_tracking, tasks), output_mp4)
+
+
+def main():
+    parameters = read_parameters(PARAMETER_FILE)
+    sim = load_simulation(DATA_FILE)
+    wall = parameters["wall"]
+    height_min = -parameters["height"]
+    height_max = parameters["height"]
+    generate_standard_mp4(sim, wall, height_min, height_max, OUTPUT_MP4)
+    generate_tracking_mp4(sim, wall, height_min, height_max, OUTPUT_TRACKING_MP4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Generate interactive HTML animations of the confined active particle
+simulation.
+
+Reads the trajectory written by the C++ code (src/data/simulation.bin) and
+builds a Plotly animation with a play button and a timestep slider, saved
+as a standalone HTML page.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import ap3d_io
+from ap3d_io import (
+    create_cylinder_surface,
+    downsample_particles,
+    load_simulation,
+    read_parameters,
+    select_tracked_particles,
+)
+
+NUM_TRACKED = 17
+
+DATA_FILE = Path("../src/data/simulation.bin")
+CSV_FILE = Path("../src/data/simulation.csv")
+PARAMETER_FILE = Path("../src/parameter.txt")
+OUTPUT_HTML = Path("simulation.html")
+OUTPUT_TRACKING_HTML = Path("simulation_tracking.html")
+
+# orjson serializes the large coordinate arrays far faster than stdlib json
+try:
+    import orjson  # noqa: F401
+
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
+
+
+def tracking_colors(num_tracked):
+    """Evenly spaced per-particle colors as hex strings for Plotly."""
+    rgb = (ap3d_io.tracking_colors(num_tracked) * 255).astype(np.uint8)
+    return ["#%02x%02x%02x" % tuple(c) for c in rgb]
+
+
+def animation_layout(title, wall, height_min, height_max, timesteps):
+    """Shared layout with play/pause buttons and a timestep slider."""
+    return go.Layout(
+        title=title,
+        scene=dict(
+            xaxis=dict(range=[-wall, wall]),
+            yaxis=dict(range=[-wall, wall]),
+            zaxis=dict(range=[height_min, height_max]),
+            aspectmode="data",
+        ),
+        showlegend=False,
+        updatemenus=[
+            dict(
+                type="buttons",
+                buttons=[
+                    dict(
+                        label="Play",
+                        method="animate",
+                        args=[
+                            None,
+                            dict(
+                                frame=dict(duration=50, redraw=True),
+                                fromcurrent=True,
+                            ),
+                        ],
+                    ),
+                    dict(
+                        label="Pause",
+                        method="animate",
+                        args=[
+                            [None],
+                            dict(frame=dict(duration=0, redraw=False), mode="immediate"),
+                        ],
+                    ),
+                ],
+            )
+        ],
+        sliders=[
+            dict(
+                steps=[
+                    dict(
+                        label=str(timestep),
+                        method="animate",
+                        args=[
+                            [str(timestep)],
+                            dict(frame=dict(duration=0, redraw=True), mode="immediate"),
+                        ],
+                    )
+                    for timestep in timesteps
+                ]
+            )
+        ],
+    )
+
+
+def create_standard_visualization(sim, wall, height_min, height_max):
+    """Build the animation with every particle colored by height."""
+    x_cyl, y_cyl, z_cyl = create_cylinder_surface(wall, height_min, height_max)
+    cylinder_trace = go.Surface(
+        x=x_cyl,
+        y=y_cyl,
+        z=z_cyl,
+        colorscale="Greys",
+        showscale=False,
+        opacity=0.1,
+    )
+    render_idx = downsample_particles(sim.positions.shape[1])
+    rendered_positions = sim.positions[:, render_idx, :]
+    frames = []
+    for idx, timestep in enumerate(sim.timesteps):
+        positions = rendered_positions[idx]
+        frames.append(
+            go.Frame(
+                data=[
+                    go.Scatter3d(
+                        x=positions[:, 0],
+                        y=positions[:, 1],
+                        z=positions[:, 2],
+                        mode="markers",
+                        marker=dict(
+                            size=5,
+                            color=positions[:, 2],
+                            colorscale="Viridis",
+                        ),
+                    ),
+                ],
+                # only update the scatter; the cylinder (trace 0) is static
+                traces=[1],
+                name=str(timestep),
+            )
+        )
+    fig = go.Figure(
+        data=[cylinder_trace, frames[0].data[0]],
+        layout=animation_layout(
+            "Active particles in cylindrical confinement",
+            wall,
+            height_min,
+            height_max,
+            sim.timesteps,
+        ),
+        frames=frames,
+    )
+    return fig
+
+
+def create_tracking_visualization(sim, wall, height_min, height_max):
+    """Build the animation with only the tracked particles, one color each."""
+    num_tracked = min(NUM_TRACKED, len(sim.particle_ids))
+    tracked_particles = select_tracked_particles(sim.particle_ids, num_tracked)
+    colors = tracking_colors(num_tracked)
+    # particle ids are positions' second axis, so tracking is one fancy index
+    tracked_positions = sim.positions[:, tracked_particles, :]
+    x_cyl, y_cyl, z_cyl = create_cylinder_surface(wall, height_min, height_max)
+    cylinder_trace = go.Surface(
+        x=x_cyl,
+        y=y_cyl,
+        z=z_cyl,
+        colorscale="Greys",
+        showscale=False,
+        opacity=0.1,
+    )
+    frames = []
+    for idx, timestep in enumerate(sim.timesteps):
+        positions = tracked_positions[idx]
+        frames.append(
+            go.Frame(
+                data=[
+                    go.Scatter3d(
+                        x=positions[:, 0],
+                        y=positions[:, 1],
+                        z=positions[:, 2],
+                        mode="markers",
+                        marker=dict(size=5, color=colors),
+                    ),
+                ],
+                # only update the scatter; the cylinder (trace 0) is static
+                traces=[1],
+                name=str(timestep),
+            )
+        )
+    fig = go.Figure(
+        data=[cylinder_trace, frames[0].data[0]],
+        layout=animation_layout(
+            "Tracked particles", wall, height_min, height_max, sim.timesteps
+        ),
+        frames=frames,
+    )
+    return fig
+
+
+def save_to_html(fig, html_file):
+    """Write the interactive animation to an HTML file."""
+    fig.write_html(
+        html_file,
+        include_plotlyjs="cdn",
+        include_mathjax=False,
+        full_html=True,
+        auto_play=False,
+    )
+
+
+def main():
+    parameters = read_parameters(PARAMETER_FILE)
+    sim = load_simulation(DATA_FILE)
+    wall = parameters["wall"]
+    height_min = -parameters["height"]
+    height_max = parameters["height"]
+    fig = create_standard_visualization(sim, wall, height_min, height_max)
+    save_to_html(fig, OUTPUT_HTML)
+    fig_tracking = create_tracking_visualization(sim, wall, height_min, height_max)
+    save_to_html(fig_tracking, OUTPUT_TRACKING_HTML)
+
+
+if __name__ == "__main__":
+    main()
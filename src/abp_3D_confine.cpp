@@ -31,9 +31,11 @@ int main(int argc, char *argv[])
 {
 	// File
 	FILE *datacsv;
+	FILE *databin;
 	FILE *parameter;
 	parameter = fopen("parameter.txt", "r");
 	datacsv = fopen("./data/simulation.csv", "w");
+	databin = fopen("./data/simulation.bin", "wb");
 
 	// check if the file parameter is exist
 	if (parameter == NULL)
@@ -98,6 +100,11 @@ int main(int argc, char *argv[])
 
 	fprintf(datacsv, "Particles,x-position,y-position,z-position,ex-orientation,ey-orientation,ez-orientation,time\n");
 
+	// binary header: number of particles and number of recorded frames
+	int num_frames = (N + 9) / 10; // one frame every 10 iterations
+	fwrite(&Particles, sizeof(int), 1, databin);
+	fwrite(&num_frames, sizeof(int), 1, databin);
+
 	// initialization position and activity
 	initialization(
 		x, y, z, ex, ey, ez, Particles,
@@ -128,6 +135,10 @@ int main(int argc, char *argv[])
 				x, y, z, ex, ey, ez,
 				Particles, time,
 				datacsv);
+			print_file_binary(
+				x, y, z, ex, ey, ez,
+				Particles, time,
+				databin);
 		}
 	}
 
@@ -143,5 +154,6 @@ int main(int argc, char *argv[])
 	free(ez);
 
 	fclose(datacsv);
+	fclose(databin);
 	return 0;
 }
@@ -8,4 +8,9 @@
 void print_file(
 	double *x, double *y, double *z, double *ex, double *ey, double *ez,
 	int Particles, int time,
-	FILE *datacsv);
\ No newline at end of file
+	FILE *datacsv);
+
+void print_file_binary(
+	double *x, double *y, double *z, double *ex, double *ey, double *ez,
+	int Particles, int time,
+	FILE *databin);
\ No newline at end of file
@@ -11,4 +11,18 @@ void print_file(
 	{
 		fprintf(datacsv, "Particles%d,%lf,%lf,%lf,%lf,%lf,%lf,%d\n", k, x[k], y[k], z[k], ex[k], ey[k], ez[k], time);
 	}
+}
+
+void print_file_binary(
+	double *x, double *y, double *z, double *ex, double *ey, double *ez,
+	int Particles, int time,
+	FILE *databin)
+{
+	fwrite(&time, sizeof(int), 1, databin);
+	fwrite(x, sizeof(double), Particles, databin);
+	fwrite(y, sizeof(double), Particles, databin);
+	fwrite(z, sizeof(double), Particles, databin);
+	fwrite(ex, sizeof(double), Particles, databin);
+	fwrite(ey, sizeof(double), Particles, databin);
+	fwrite(ez, sizeof(double), Particles, databin);
 }
\ No newline at end of file